@@ -4,15 +4,136 @@ A comprehensive database system for managing university research laboratory oper
 """
 
 import psycopg2
-from psycopg2 import sql, Error
-from psycopg2.extras import RealDictCursor
+from psycopg2 import sql, Error, OperationalError
+from psycopg2.extras import RealDictCursor, execute_values, register_default_json
+from psycopg2.pool import ThreadedConnectionPool
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, date
 from decimal import Decimal
+from functools import lru_cache, partial
+import atexit
+import hashlib
+import io
+import json
 import os
-from typing import Optional, List, Dict, Any, Tuple
+import signal
+import sys
+import time
+from typing import Optional, List, Dict, Any, Tuple, Iterator, Callable
 from tabulate import tabulate
 
 
+# Seconds that memoized read-only list queries stay fresh; any write through the executor drops them
+QUERY_CACHE_TTL = 30
+
+# Rows per page for the keyset-paginated listings (equipment, publications)
+PAGE_SIZE = 50
+
+# Also defined in schema.sql; recreated at startup so databases set up before it existed get it
+PROJECTS_WITH_LEADER_VIEW = """CREATE OR REPLACE VIEW v_projects_with_leader AS
+    SELECT p.PID AS pid, p.Title AS title, p.Status AS status, p.SDate AS start_date,
+           p.EDate AS end_date, COALESCE(lm.Name, 'Unassigned') AS leader
+    FROM PROJECT p LEFT JOIN LAB_MEMBER lm ON p.LeaderMID = lm.MID"""
+
+# Also in schema.sql; indexes the report and equipment queries filter or join on beyond the primary keys
+REPORT_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_uses_eid_edate ON USES(EID, EDate)",
+    "CREATE INDEX IF NOT EXISTS idx_publishes_pubid ON PUBLISHES(PubID)",
+    "CREATE INDEX IF NOT EXISTS idx_funds_pid ON FUNDS(PID)",
+    "CREATE INDEX IF NOT EXISTS idx_publication_pubdate_pubid ON PUBLICATION(PubDate DESC, PubID DESC)",
+    # Superseded by the composite indexes above; dropped so writes don't maintain both
+    "DROP INDEX IF EXISTS idx_uses_eid",
+    "DROP INDEX IF EXISTS idx_publication_date",
+]
+
+# SQL for the equipment and report screens, built once at import; each maps to one prepared statement
+Q_GRANTS = "SELECT GID AS gid, Source AS source, Budget AS budget FROM GRANT_TABLE ORDER BY GID"
+
+# Active usage is counted once per EID, then joined onto the equipment rows;
+# one page of equipment after the given EID (0 for the first page)
+Q_LIST_EQUIPMENT = """SELECT e.EID AS eid, e.EName AS name, e.EType AS type, e.PDate AS purchase_date, e.Status AS status,
+    COALESCE(u.cnt, 0) AS current_users
+    FROM EQUIPMENT e LEFT JOIN (
+        SELECT EID, COUNT(*) AS cnt FROM USES
+        WHERE EDate IS NULL OR EDate >= CURRENT_DATE GROUP BY EID) u ON u.EID = e.EID
+    WHERE e.EID > %s ORDER BY e.EID LIMIT %s"""
+
+# Current users come back as a JSON array on the equipment row, so this is one round trip
+Q_EQUIPMENT_STATUS = """SELECT e.EID AS eid, e.EName AS name, e.EType AS type, e.PDate AS purchase_date, e.Status AS status,
+    COALESCE((SELECT json_agg(json_build_object('name', lm.Name, 'type', lm.MType,
+                                                'start_date', u.SDate, 'purpose', u.Purpose)
+                              ORDER BY u.SDate)
+              FROM USES u JOIN LAB_MEMBER lm ON u.MID = lm.MID
+              WHERE u.EID = e.EID AND (u.EDate IS NULL OR u.EDate >= CURRENT_DATE)), '[]'::json) AS users
+    FROM EQUIPMENT e
+    WHERE e.EID = %s"""
+
+# mem_proj is referenced once, so PostgreSQL 12+ inlines it into the correlated subquery: each
+# member's DISTINCT runs over just that member's active projects, not the whole table.
+# The outer DISTINCT keeps one row per member and purpose, as the former GROUP BY did
+Q_EQUIPMENT_USERS_AND_PROJECTS = """WITH mem_proj AS (
+        SELECT DISTINCT w.MID, p.Title
+        FROM WORKS w JOIN (SELECT PID, Title FROM PROJECT WHERE Status = 'Active') p ON w.PID = p.PID)
+    SELECT DISTINCT lm.MID AS mid, lm.Name AS name, lm.MType AS type, u.Purpose AS purpose,
+    (SELECT STRING_AGG(mp.Title, ', ' ORDER BY mp.Title) FROM mem_proj mp WHERE mp.MID = lm.MID) AS projects
+    FROM USES u JOIN LAB_MEMBER lm ON u.MID = lm.MID
+    WHERE u.EID = %s AND (u.EDate IS NULL OR u.EDate >= CURRENT_DATE)
+    ORDER BY lm.Name"""
+
+Q_USABLE_EQUIPMENT = "SELECT EID AS eid, EName AS name, Status AS status FROM EQUIPMENT WHERE Status != 'Retired' ORDER BY EID"
+
+Q_ACTIVE_USAGE = """SELECT u.MID AS mid, lm.Name AS name, u.SDate AS start_date, u.Purpose AS purpose
+    FROM USES u JOIN LAB_MEMBER lm ON u.MID = lm.MID
+    WHERE u.EID = %s AND (u.EDate IS NULL OR u.EDate >= CURRENT_DATE) ORDER BY u.SDate"""
+
+# RANK() finds the top count in the same pass as the grouping; ties all get rank 1
+Q_MOST_PUBLICATIONS = """SELECT mid, name, type, pub_count FROM (
+        SELECT lm.MID AS mid, lm.Name AS name, lm.MType AS type, COUNT(p.PubID) AS pub_count,
+               RANK() OVER (ORDER BY COUNT(p.PubID) DESC) AS rnk
+        FROM LAB_MEMBER lm LEFT JOIN PUBLISHES p ON lm.MID = p.MID
+        GROUP BY lm.MID, lm.Name, lm.MType) t
+    WHERE rnk = 1 ORDER BY name"""
+
+Q_AVG_PUBLICATIONS_BY_MAJOR = """SELECT s.Major AS major, COUNT(DISTINCT s.MID) AS students, COUNT(p.PubID) AS total_pubs,
+    ROUND(COUNT(p.PubID)::DECIMAL / NULLIF(COUNT(DISTINCT s.MID), 0), 2) AS avg_pubs
+    FROM STUDENT s LEFT JOIN PUBLISHES p ON s.MID = p.MID
+    GROUP BY s.Major ORDER BY avg_pubs DESC"""
+
+# Projects are narrowed to the period first; count and details come from one round trip
+Q_FUNDED_ACTIVE_PROJECTS = """WITH active AS (
+        SELECT PID, Title, Status, SDate, EDate FROM PROJECT
+        WHERE SDate <= %s AND (EDate IS NULL OR EDate >= %s))
+    SELECT a.PID AS pid, a.Title AS title, a.Status AS status, a.SDate AS start_date, a.EDate AS end_date,
+    (SELECT STRING_AGG(DISTINCT g.Source, ', ') FROM FUNDS f JOIN GRANT_TABLE g ON f.GID = g.GID
+     WHERE f.PID = a.PID) AS grants
+    FROM active a WHERE EXISTS (SELECT 1 FROM FUNDS f WHERE f.PID = a.PID) ORDER BY a.Title"""
+
+Q_PROLIFIC_MEMBERS_BY_GRANT = """SELECT lm.MID AS mid, lm.Name AS name, lm.MType AS type, COUNT(DISTINCT pub.PubID) AS pub_count
+    FROM FUNDS f JOIN PROJECT p ON f.PID = p.PID
+    JOIN WORKS w ON p.PID = w.PID JOIN LAB_MEMBER lm ON w.MID = lm.MID
+    LEFT JOIN PUBLISHES pub ON lm.MID = pub.MID
+    WHERE f.GID = %s GROUP BY lm.MID, lm.Name, lm.MType ORDER BY pub_count DESC LIMIT 3"""
+
+_PUBLICATIONS_SELECT = """SELECT pub.PubID AS pubid, pub.Title AS title, pub.PubDate AS date, pub.Venue AS venue,
+    (SELECT COALESCE(STRING_AGG(lm.Name, ', ' ORDER BY lm.Name), 'No authors')
+     FROM PUBLISHES p JOIN LAB_MEMBER lm ON p.MID = lm.MID WHERE p.PubID = pub.PubID) AS authors
+    FROM PUBLICATION pub"""
+
+# Newest first; PubID breaks date ties so the (PubDate, PubID) keyset resumes exactly where a page ended
+Q_LIST_PUBLICATIONS = _PUBLICATIONS_SELECT + """
+    ORDER BY pub.PubDate DESC, pub.PubID DESC LIMIT %s"""
+
+Q_LIST_PUBLICATIONS_AFTER = _PUBLICATIONS_SELECT + """
+    WHERE (pub.PubDate, pub.PubID) < (%s, %s)
+    ORDER BY pub.PubDate DESC, pub.PubID DESC LIMIT %s"""
+
+Q_LIST_GRANTS = """SELECT g.GID AS gid, g.Source AS source, g.Budget AS budget, g.StartDate AS start_date,
+    g.Duration AS duration,
+    (SELECT COALESCE(STRING_AGG(p.Title, ', '), 'None')
+     FROM FUNDS f JOIN PROJECT p ON f.PID = p.PID WHERE f.GID = g.GID) AS projects
+    FROM GRANT_TABLE g ORDER BY g.StartDate DESC"""
+
+
 class DatabaseConfig:
     def __init__(self):
         self.host = os.getenv('DB_HOST', 'localhost')
@@ -20,22 +141,43 @@ class DatabaseConfig:
         self.database = os.getenv('DB_NAME', 'research_lab_manager')
         self.user = os.getenv('DB_USER', 'postgres')
         self.password = os.getenv('DB_PASSWORD', 'postgres')
+        self.min_conn = 1
+        self.max_conn = 10
+
+
+class PooledConnection(psycopg2.extensions.connection):
+    """Connection handed out by the pool; tracks statements prepared on its session."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_names = set()
+
+
+def create_pool(config: DatabaseConfig) -> ThreadedConnectionPool:
+    """Open a connection pool holding config.min_conn connections up front."""
+    return ThreadedConnectionPool(
+        config.min_conn,
+        config.max_conn,
+        host=config.host,
+        port=config.port,
+        database=config.database,
+        user=config.user,
+        password=config.password,
+        connection_factory=PooledConnection
+    )
 
 
 class DatabaseConnection:
-    def __init__(self, config: DatabaseConfig = None):
-        self.config = config or DatabaseConfig()
+    def __init__(self, pool: ThreadedConnectionPool, read_only: bool = False):
+        self.pool = pool
         self.connection = None
+        # Read-only work runs in autocommit, so no COMMIT/ROLLBACK round trip is sent on exit
+        self.read_only = read_only
     
     def connect(self):
         try:
-            self.connection = psycopg2.connect(
-                host=self.config.host,
-                port=self.config.port,
-                database=self.config.database,
-                user=self.config.user,
-                password=self.config.password
-            )
+            self.connection = self.pool.getconn()
+            if self.read_only:
+                self.connection.autocommit = True
             return self.connection
         except Error as e:
             print(f"\n[ERROR] Error connecting to database: {e}")
@@ -47,15 +189,25 @@ class DatabaseConnection:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.connection:
-            if exc_type is None:
-                self.connection.commit()
-            else:
-                self.connection.rollback()
-            self.connection.close()
+            try:
+                # A connection the server dropped has nothing left to commit or roll back
+                if not self.read_only and not self.connection.closed:
+                    if exc_type is None:
+                        self.connection.commit()
+                    else:
+                        self.connection.rollback()
+            finally:
+                if self.read_only and not self.connection.closed:
+                    self.connection.autocommit = False
+                self.pool.putconn(self.connection)
+                self.connection = None
 
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI clear + cursor home; skipped when output is piped so no escape codes leak into it
+    if sys.stdout.isatty():
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
 
 def print_header(title: str):
     print("\n" + "=" * 60)
@@ -77,17 +229,27 @@ def print_warning(message: str):
 def print_info(message: str):
     print(f"\n[INFO] {message}")
 
+def _fmt_money(value: Any, default: str) -> str:
+    return f"${value:,.2f}" if value >= 1000 else f"${value:.2f}"
+
+def _fmt_date(value: Any, default: str) -> str:
+    return value.strftime('%Y-%m-%d')
+
+def _fmt_str(value: Any, default: str) -> str:
+    return str(value)
+
+# Exact-type dispatch: one dict lookup per value instead of an isinstance chain
+_FORMATTERS = {
+    type(None): lambda value, default: default,
+    Decimal: _fmt_money,
+    float: _fmt_money,
+    date: _fmt_date,
+    datetime: _fmt_date,
+}
+
 def format_value(value: Any, default: str = "N/A") -> str:
     """Format a value for display, handling None, Decimal, float, and date values."""
-    if value is None:
-        return default
-    if isinstance(value, Decimal):
-        return f"${value:,.2f}" if value >= 1000 else f"${value:.2f}"
-    if isinstance(value, float):
-        return f"${value:,.2f}" if value >= 1000 else f"${value:.2f}"
-    if isinstance(value, date):
-        return value.strftime('%Y-%m-%d')
-    return str(value)
+    return _FORMATTERS.get(type(value), _fmt_str)(value, default)
 
 
 def format_currency(value: Any, default: str = "N/A") -> str:
@@ -148,65 +310,127 @@ def get_float_input(prompt: str, min_val: float = None, max_val: float = None, a
         except (EOFError, KeyboardInterrupt):
             return None
 
+def _parse_date_fast(value: str) -> date:
+    """Parse YYYY-MM-DD without strptime, falling back to it for unpadded forms like 2024-1-5."""
+    if len(value) == 10 and value[4] == '-' and value[7] == '-' and (value[:4] + value[5:7] + value[8:]).isdigit():
+        return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
 def get_date_input(prompt: str, allow_empty: bool = False) -> Optional[date]:
     while True:
         try:
             value = input(prompt).strip()
             if not value and allow_empty:
                 return None
-            return datetime.strptime(value, '%Y-%m-%d').date()
+            return _parse_date_fast(value)
         except ValueError:
             print("Please enter a valid date in YYYY-MM-DD format.")
         except (EOFError, KeyboardInterrupt):
             return None
 
 def get_choice(prompt: str, choices: List[str], allow_empty: bool = False) -> Optional[str]:
-    choices_lower = [c.lower() for c in choices]
+    lookup = {c.lower(): c for c in choices}
     while True:
         try:
             value = input(prompt).strip()
             if not value and allow_empty:
                 return None
-            if value.lower() in choices_lower:
-                return choices[choices_lower.index(value.lower())]
+            if (match := lookup.get(value.lower())) is not None:
+                return match
             print(f"Please enter one of: {', '.join(choices)}")
         except (EOFError, KeyboardInterrupt):
             return None
 
-def format_table(data: List[Dict], headers: List[str] = None) -> str:
-    """Format data as a table, properly handling all data types."""
+def _cell_number(value: Any, is_currency: bool) -> str:
+    return f"${float(value):,.2f}" if is_currency else f"{float(value):,.2f}"
+
+def _cell_date(value: Any, is_currency: bool) -> str:
+    return value.strftime('%Y-%m-%d')
+
+def _cell_raw(value: Any, is_currency: bool) -> Any:
+    return value
+
+_CELL_FORMATTERS = {
+    type(None): lambda value, is_currency: 'N/A',
+    Decimal: _cell_number,
+    float: _cell_number,
+    date: _cell_date,
+    datetime: _cell_date,
+}
+
+@lru_cache(maxsize=None)
+def _make_row_formatter(layout: Tuple[Tuple[Any, Any, bool], ...], by_position: bool) -> Callable[[List[Any]], List[List[Any]]]:
+    """Compile a loop that formats every row for one column layout, with the per-column work unrolled.
+
+    layout holds (key, fallback key, is_currency) per column; with by_position the key is a
+    tuple index (None for a missing column), otherwise a dict key tried before the fallback.
+    """
+    lines = ["def format_rows(data):", "    rows = []", "    for r in data:"]
+    for n, (key, fallback, _) in enumerate(layout):
+        if by_position:
+            expr = f"r[{key}]" if key is not None else "''"
+        else:
+            expr = f"(r[{key!r}] if {key!r} in r else r.get({fallback!r}, ''))"
+        lines.append(f"        v{n} = {expr}")
+    cells = ", ".join(f"cell(type(v{n}), raw)(v{n}, {currency})" for n, (_, _, currency) in enumerate(layout))
+    lines += [f"        rows.append([{cells}])", "    return rows"]
+    namespace = {'cell': _CELL_FORMATTERS.get, 'raw': _cell_raw}
+    exec("\n".join(lines), namespace)
+    return namespace['format_rows']
+
+def format_table(data: List[Any], headers: List[str] = None, columns: List[str] = None) -> str:
+    """Format data as a table, properly handling all data types.
+
+    Rows are dicts, or tuples when columns gives their field names in order.
+    """
     if not data:
         return "No data found."
     if headers is None:
-        headers = list(data[0].keys())
-    rows = []
-    for row in data:
-        formatted_row = []
-        for h in headers:
-            value = row.get(h, row.get(h.lower(), ''))
-            # Format based on type
-            if value is None:
-                formatted_row.append('N/A')
-            elif isinstance(value, Decimal) or isinstance(value, float):
-                # Check if this looks like a currency/budget field
-                if 'budget' in h.lower() or 'cost' in h.lower() or 'price' in h.lower():
-                    formatted_row.append(f"${float(value):,.2f}")
-                else:
-                    formatted_row.append(f"{float(value):,.2f}")
-            elif isinstance(value, date):
-                formatted_row.append(value.strftime('%Y-%m-%d'))
-            else:
-                formatted_row.append(value)
-        rows.append(formatted_row)
+        headers = list(columns) if columns is not None else list(data[0].keys())
+    # Resolve each column's key and currency/budget flag once; the row loop itself is compiled per layout
+    cols = []
+    for h in headers:
+        h_lower = h.lower()
+        cols.append((h, h_lower, any(k in h_lower for k in ('budget', 'cost', 'price'))))
+    if columns is not None:
+        positions = {name: i for i, name in enumerate(columns)}
+        layout = tuple((positions.get(h, positions.get(h_lower)), None, currency) for h, h_lower, currency in cols)
+    else:
+        layout = tuple(cols)
+    rows = _make_row_formatter(layout, columns is not None)(data)
     return tabulate(rows, headers=headers, tablefmt='grid')
 
+_YES = frozenset({'y', 'yes'})
+
 def confirm_action(prompt: str = "Are you sure? (y/n): ") -> bool:
     try:
-        response = input(prompt).strip().lower()
-        return response in ('y', 'yes')
+        return input(prompt).strip().lower() in _YES
+    except (EOFError, KeyboardInterrupt):
+        return False
+
+def next_page_requested() -> bool:
+    try:
+        return input("Press N for next page, or Enter to stop: ").strip().lower() == 'n'
     except (EOFError, KeyboardInterrupt):
         return False
 
+def print_pages(fetch_page: Callable[[Optional[Dict]], Tuple[bool, Any]], headers: List[str], empty_message: str) -> None:
+    """Print a keyset-paginated listing; fetch_page(last_row) returns the page after last_row (None for the first)."""
+    last_row = None
+    while True:
+        success, page = fetch_page(last_row)
+        if not success:
+            print_error(f"Failed: {page}")
+            return
+        if not page:
+            if last_row is None:
+                print(empty_message)
+            return
+        print(format_table(page, headers))
+        if len(page) < PAGE_SIZE or not next_page_requested():
+            return
+        last_row = page[-1]
+
 def pause():
     try:
         input("\nPress Enter to continue...")
@@ -214,41 +438,226 @@ def pause():
         pass
 
 
+def _to_positional(query: str) -> str:
+    """Rewrite psycopg2 %s placeholders as $1, $2, ... for use in PREPARE."""
+    parts = query.split('%s')
+    return parts[0] + ''.join(f"${i}{part}" for i, part in enumerate(parts[1:], 1))
+
+
 class QueryExecutor:
-    def __init__(self, config: DatabaseConfig = None):
-        self.config = config or DatabaseConfig()
+    def __init__(self, pool: ThreadedConnectionPool):
+        self.pool = pool
+        # SQL text -> server-side prepared statement name
+        self._prepared: Dict[str, str] = {}
+        # (SQL text, params) -> (fetched at, epoch, rows); entries from an older epoch are stale
+        self._cache: Dict[Tuple[str, tuple], Tuple[float, int, List[Dict]]] = {}
+        self._cache_epoch = 0
+    
+    def _run(self, work: Callable[[Any], Any], read_only: bool = False) -> Any:
+        """Call work(conn) on a pooled connection and return its result.
+
+        A pooled connection that the server dropped (restart, idle timeout) only fails
+        on first use; in that case the dead connection is discarded and work runs once
+        more on a fresh one. Only a failure inside work is retried: the server rolls back
+        an interrupted transaction, but a failed COMMIT may still have gone through, and
+        repeating it could insert twice. Anything that is not read_only may have written,
+        so it also invalidates the query cache.
+        """
+        try:
+            for attempt in range(2):
+                conn = None
+                committing = False
+                try:
+                    with DatabaseConnection(self.pool, read_only=read_only) as conn:
+                        result = work(conn)
+                        committing = True
+                    return result
+                except OperationalError:
+                    if attempt or committing or conn is None or not conn.closed:
+                        raise
+        finally:
+            if not read_only:
+                self._cache_epoch += 1
+    
+    def _statement_name(self, query: str) -> str:
+        name = self._prepared.get(query)
+        if name is None:
+            name = self._prepared[query] = "q_" + hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
+        return name
     
-    def execute_query(self, query: str, params: tuple = None, fetch: bool = True) -> Tuple[bool, Any]:
+    def execute_query(self, query: str, params: tuple = None, fetch: bool = True, cached: bool = False) -> Tuple[bool, Any]:
+        """Run a query; SELECTs (fetch=True) go through a prepared statement so repeats skip parse/plan.
+
+        With cached=True the rows are memoized for QUERY_CACHE_TTL seconds, or until the next write.
+        """
+        if fetch and cached:
+            key = (query, tuple(params or ()))
+            entry = self._cache.get(key)
+            if entry and entry[1] == self._cache_epoch and time.monotonic() - entry[0] < QUERY_CACHE_TTL:
+                return True, entry[2]
+            # Age the rows from when the query was sent, and tie them to the epoch seen then, so a
+            # write that lands while a background fetch is in flight still makes them stale
+            fetched_at, epoch = time.monotonic(), self._cache_epoch
+            success, result = self.execute_prepared(self._statement_name(query), query, params)
+            if success:
+                self._cache[key] = (fetched_at, epoch, result)
+            return success, result
+        if fetch:
+            return self.execute_prepared(self._statement_name(query), query, params)
+        def work(conn):
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                return cur.rowcount
         try:
-            with DatabaseConnection(self.config) as conn:
-                with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                    cur.execute(query, params)
-                    if fetch:
-                        results = cur.fetchall()
-                        return True, [dict(row) for row in results]
-                    return True, cur.rowcount
+            return True, self._run(work)
         except Error as e:
             return False, str(e)
     
-    def execute_insert(self, query: str, params: tuple = None) -> Tuple[bool, Any]:
+    def execute_query_stream(self, query: str, params: tuple = None, itersize: int = 500) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """Yield (column names, rows) in batches of up to itersize from a server-side cursor; raises Error on failure.
+
+        Rows are plain tuples in column order rather than dicts, so large listings don't build
+        a dict per row; pass the names to format_table as columns. As in _run, a pooled
+        connection the server dropped is replaced once, provided nothing was yielded yet.
+        """
+        for attempt in range(2):
+            conn = None
+            yielded = False
+            try:
+                with DatabaseConnection(self.pool) as conn:
+                    with conn.cursor(name='lrm_stream') as cur:
+                        cur.itersize = itersize
+                        cur.execute(query, params)
+                        columns = None
+                        while True:
+                            batch = cur.fetchmany(itersize)
+                            if not batch:
+                                break
+                            if columns is None:
+                                columns = [d.name for d in cur.description]
+                            yielded = True
+                            yield columns, batch
+                return
+            except OperationalError:
+                if attempt or yielded or conn is None or not conn.closed:
+                    raise
+    
+    def execute_prepared(self, name: str, query: str, params: tuple = None) -> Tuple[bool, Any]:
+        """Run a SELECT as a named server-side prepared statement, preparing it once per pooled connection.
+
+        query uses %s placeholders (no literal "%s" text); they are rewritten to $1, $2, ... for PREPARE.
+        The first use on a connection sends PREPARE and EXECUTE together, so it costs no extra round trip.
+        """
+        params = tuple(params or ()) or None
+        args = f"({', '.join(['%s'] * len(params))})" if params else ""
+        def work(conn):
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                if name in conn.prepared_names:
+                    cur.execute(f"EXECUTE {name}{args}", params)
+                    return cur.fetchall()
+                # First use on this connection: PREPARE and EXECUTE share one round trip
+                prepare = _to_positional(query)
+                if params:
+                    prepare = prepare.replace('%', '%%')
+                try:
+                    cur.execute(f"PREPARE {name} AS {prepare}; EXECUTE {name}{args}", params)
+                except Error:
+                    # The PREPARE may have succeeded even though the EXECUTE failed; drop it so the
+                    # next call prepares afresh instead of hitting "already exists"
+                    if not conn.closed:
+                        try:
+                            cur.execute(f"DEALLOCATE {name}")
+                        except Error:
+                            pass
+                    raise
+                conn.prepared_names.add(name)
+                return cur.fetchall()
         try:
-            with DatabaseConnection(self.config) as conn:
-                with conn.cursor() as cur:
-                    cur.execute(query, params)
-                    try:
-                        result = cur.fetchone()
-                        return True, result[0] if result else None
-                    except:
-                        return True, None
+            return True, self._run(work, read_only=True)
         except Error as e:
             return False, str(e)
     
+    def execute_batched_json(self, queries: List[Tuple[str, tuple]]) -> Tuple[bool, Any]:
+        """Run several SELECTs as one statement, returning one list of row dicts per query.
+
+        Each query becomes a json_agg subquery of a single SELECT, so this is one round trip
+        but not protocol pipelining. Limits of the JSON route:
+        - Row order relies on json_agg consuming each query's ORDER BY in order, which
+          PostgreSQL documents as usually, not always, holding. Callers that need a strict
+          order should sort the returned rows.
+        - Values come back as JSON types: numbers as Decimal, but dates and timestamps as
+          ISO strings rather than date objects.
+        """
+        columns = [f"(SELECT COALESCE(json_agg(t), '[]'::json) FROM ({query}) t)" for query, _ in queries]
+        params = tuple(value for _, query_params in queries for value in (query_params or ()))
+        def work(conn):
+            with conn.cursor() as cur:
+                register_default_json(cur, loads=partial(json.loads, parse_float=Decimal))
+                cur.execute("SELECT " + ", ".join(columns), params)
+                return list(cur.fetchone())
+        try:
+            return True, self._run(work, read_only=True)
+        except Error as e:
+            return False, str(e)
+    
+    def execute_returning(self, query: str, params: tuple = None) -> Tuple[bool, Optional[Dict]]:
+        """Run a write and return the first row of its RETURNING clause as a dict (None if no row came back)."""
+        def work(conn):
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute(query, params)
+                return cur.fetchone() if cur.description else None
+        try:
+            return True, self._run(work)
+        except Error as e:
+            return False, str(e)
+    
+    def execute_insert(self, query: str, params: tuple = None) -> Tuple[bool, Any]:
+        """Like execute_returning, but return only the first RETURNING column (e.g. the new ID)."""
+        success, row = self.execute_returning(query, params)
+        if success and row is not None:
+            return True, next(iter(row.values()))
+        return success, row
+    
     def execute_update(self, query: str, params: tuple = None) -> Tuple[bool, int]:
+        def work(conn):
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                return cur.rowcount
         try:
-            with DatabaseConnection(self.config) as conn:
-                with conn.cursor() as cur:
-                    cur.execute(query, params)
-                    return True, cur.rowcount
+            return True, self._run(work)
+        except Error as e:
+            return False, str(e)
+    
+    def copy_from_rows(self, table: str, columns: List[str], rows: List[tuple]) -> Tuple[bool, int]:
+        """Bulk-load rows into table with COPY ... FROM STDIN, much faster than row-by-row INSERTs."""
+        # Quoted fields are always text in CSV mode; an unquoted empty field is NULL
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(",".join('' if v is None else '"' + str(v).replace('"', '""') + '"' for v in row))
+            buffer.write("\n")
+        # Identifiers are lowercased to match the unquoted names used in schema.sql
+        copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+            sql.Identifier(table.lower()),
+            sql.SQL(", ").join(sql.Identifier(c.lower()) for c in columns)
+        )
+        def work(conn):
+            buffer.seek(0)
+            with conn.cursor() as cur:
+                cur.copy_expert(copy_sql, buffer)
+                return cur.rowcount
+        try:
+            return True, self._run(work)
+        except Error as e:
+            return False, str(e)
+    
+    def execute_values_batch(self, query: str, rows: List[tuple], page_size: int = 100) -> Tuple[bool, int]:
+        """Insert many rows with multi-row VALUES statements; query must contain a single VALUES %s."""
+        def work(conn):
+            with conn.cursor() as cur:
+                execute_values(cur, query, rows, page_size=page_size)
+                return len(rows)
+        try:
+            return True, self._run(work)
         except Error as e:
             return False, str(e)
 
@@ -268,12 +677,18 @@ class MemberManager:
             LEFT JOIN COLLABORATOR c ON lm.MID = c.MID
             ORDER BY lm.MID
         """
-        success, result = self.executor.execute_query(query)
-        if success:
-            print_subheader("All Lab Members")
-            print(format_table(result, ['mid', 'name', 'type', 'join_date', 'details']) if result else "No members found.")
-        else:
-            print_error(f"Failed to retrieve members: {result}")
+        try:
+            found = False
+            for columns, batch in self.executor.execute_query_stream(query):
+                if not found:
+                    print_subheader("All Lab Members")
+                    found = True
+                print(format_table(batch, ['mid', 'name', 'type', 'join_date', 'details'], columns=columns))
+            if not found:
+                print_subheader("All Lab Members")
+                print("No members found.")
+        except Error as e:
+            print_error(f"Failed to retrieve members: {e}")
     
     def search_members(self) -> None:
         print_subheader("Search Members")
@@ -285,7 +700,7 @@ class MemberManager:
         if choice == 1:
             name = get_input("Enter name to search: ")
             if not name: return
-            query = "SELECT lm.MID AS mid, lm.Name AS name, lm.MType AS type FROM LAB_MEMBER lm WHERE LOWER(lm.Name) LIKE LOWER(%s) ORDER BY lm.Name"
+            query = "SELECT lm.MID AS mid, lm.Name AS name, lm.MType AS type FROM LAB_MEMBER lm WHERE lm.Name ILIKE %s ORDER BY lm.Name"
             params = (f'%{name}%',)
         elif choice == 2:
             mtype = get_choice("Enter type (Faculty/Student/Collaborator): ", ['Faculty', 'Student', 'Collaborator'])
@@ -295,12 +710,17 @@ class MemberManager:
         else:
             search_term = get_input("Enter department/major/affiliation to search: ")
             if not search_term: return
-            query = """SELECT lm.MID AS mid, lm.Name AS name, lm.MType AS type,
-                       COALESCE(f.Department, s.Major, c.Affiliation) AS details
-                       FROM LAB_MEMBER lm LEFT JOIN FACULTY f ON lm.MID = f.MID
-                       LEFT JOIN STUDENT s ON lm.MID = s.MID LEFT JOIN COLLABORATOR c ON lm.MID = c.MID
-                       WHERE LOWER(COALESCE(f.Department, s.Major, c.Affiliation, '')) LIKE LOWER(%s) ORDER BY lm.Name"""
-            params = (f'%{search_term}%',)
+            # One branch per specialization table, so each ILIKE can use that column's trigram index
+            query = """SELECT lm.MID AS mid, lm.Name AS name, lm.MType AS type, f.Department AS details
+                       FROM FACULTY f JOIN LAB_MEMBER lm ON lm.MID = f.MID WHERE f.Department ILIKE %s
+                       UNION ALL
+                       SELECT lm.MID, lm.Name, lm.MType, s.Major
+                       FROM STUDENT s JOIN LAB_MEMBER lm ON lm.MID = s.MID WHERE s.Major ILIKE %s
+                       UNION ALL
+                       SELECT lm.MID, lm.Name, lm.MType, c.Affiliation
+                       FROM COLLABORATOR c JOIN LAB_MEMBER lm ON lm.MID = c.MID WHERE c.Affiliation ILIKE %s
+                       ORDER BY name"""
+            params = (f'%{search_term}%',) * 3
         
         success, result = self.executor.execute_query(query, params)
         if success:
@@ -319,7 +739,9 @@ class MemberManager:
                    FROM LAB_MEMBER lm LEFT JOIN FACULTY f ON lm.MID = f.MID
                    LEFT JOIN STUDENT s ON lm.MID = s.MID LEFT JOIN COLLABORATOR c ON lm.MID = c.MID
                    WHERE lm.MID = %s"""
-        success, result = self.executor.execute_query(query, (mid,))
+        proj_query = "SELECT p.Title AS title, w.Role AS role, w.Hours AS hours, p.Status AS status FROM WORKS w JOIN PROJECT p ON w.PID = p.PID WHERE w.MID = %s ORDER BY p.Status, p.Title"
+        success, results = self.executor.execute_batched_json([(query, (mid,)), (proj_query, (mid,))])
+        result, projects = results if success else ([], [])
         
         if success and result:
             m = result[0]
@@ -335,9 +757,7 @@ class MemberManager:
             elif mtype == 'Collaborator':
                 print(f"  Affiliation: {format_value(m.get('affiliation'))}\n  Biography: {format_value(m.get('biography'), 'Not provided')}")
             
-            proj_query = "SELECT p.Title AS title, w.Role AS role, w.Hours AS hours, p.Status AS status FROM WORKS w JOIN PROJECT p ON w.PID = p.PID WHERE w.MID = %s ORDER BY p.Status, p.Title"
-            success2, projects = self.executor.execute_query(proj_query, (mid,))
-            if success2 and projects:
+            if projects:
                 print_subheader("Projects")
                 print(format_table(projects, ['title', 'role', 'hours', 'status']))
             else:
@@ -412,8 +832,8 @@ class MemberManager:
             elif mtype == 'Student':
                 level = get_choice("Enter new level: ", ['Freshman', 'Sophomore', 'Junior', 'Senior', 'Graduate'])
                 major = get_input("Enter new major: ")
-                if level: self.executor.execute_update("UPDATE STUDENT SET Level = %s WHERE MID = %s", (level, mid))
-                if major: self.executor.execute_update("UPDATE STUDENT SET Major = %s WHERE MID = %s", (major, mid))
+                if level or major:
+                    self.executor.execute_update("UPDATE STUDENT SET Level = COALESCE(%s, Level), Major = COALESCE(%s, Major) WHERE MID = %s", (level or None, major or None, mid))
             else:
                 affil = get_input("Enter new affiliation: ")
                 if affil: self.executor.execute_update("UPDATE COLLABORATOR SET Affiliation = %s WHERE MID = %s", (affil, mid))
@@ -433,8 +853,13 @@ class MemberManager:
         print_warning("This will remove all associated records.")
         
         if confirm_action():
-            success, _ = self.executor.execute_update("DELETE FROM LAB_MEMBER WHERE MID = %s", (mid,))
-            print_success("Member removed.") if success else print_error("Failed to remove member.")
+            success, count = self.executor.execute_update("DELETE FROM LAB_MEMBER WHERE MID = %s", (mid,))
+            if not success:
+                print_error("Failed to remove member.")
+            elif count == 0:
+                print_error(f"Member with ID {mid} not found.")
+            else:
+                print_success("Member removed.")
         else:
             print_info("Operation cancelled.")
 
@@ -443,17 +868,27 @@ class ProjectManager:
     def __init__(self, executor: QueryExecutor):
         self.executor = executor
     
+    def _get_faculty(self) -> Tuple[bool, Any]:
+        query = "SELECT lm.MID AS mid, lm.Name AS name, f.Department AS dept FROM LAB_MEMBER lm JOIN FACULTY f ON lm.MID = f.MID ORDER BY lm.Name"
+        return self.executor.execute_query(query, cached=True)
+    
+    def _get_grants(self) -> Tuple[bool, Any]:
+        return self.executor.execute_query(Q_GRANTS, cached=True)
+    
     def list_all_projects(self) -> None:
-        query = """SELECT p.PID AS pid, p.Title AS title, p.Status AS status,
-                   p.SDate AS start_date, p.EDate AS end_date, COALESCE(lm.Name, 'Unassigned') AS leader
-                   FROM PROJECT p LEFT JOIN LAB_MEMBER lm ON p.LeaderMID = lm.MID
-                   ORDER BY p.Status, p.SDate DESC"""
-        success, result = self.executor.execute_query(query)
-        if success:
-            print_subheader("All Projects")
-            print(format_table(result, ['pid', 'title', 'status', 'start_date', 'end_date', 'leader']) if result else "No projects found.")
-        else:
-            print_error(f"Failed to retrieve projects: {result}")
+        query = "SELECT pid, title, status, start_date, end_date, leader FROM v_projects_with_leader ORDER BY status, start_date DESC"
+        try:
+            found = False
+            for columns, batch in self.executor.execute_query_stream(query):
+                if not found:
+                    print_subheader("All Projects")
+                    found = True
+                print(format_table(batch, ['pid', 'title', 'status', 'start_date', 'end_date', 'leader'], columns=columns))
+            if not found:
+                print_subheader("All Projects")
+                print("No projects found.")
+        except Error as e:
+            print_error(f"Failed to retrieve projects: {e}")
     
     def get_project_status(self) -> None:
         pid = get_int_input("Enter Project ID: ", min_val=1)
@@ -464,7 +899,11 @@ class ProjectManager:
                    lm.Name AS leader_name, f.Department AS leader_dept
                    FROM PROJECT p LEFT JOIN LAB_MEMBER lm ON p.LeaderMID = lm.MID
                    LEFT JOIN FACULTY f ON p.LeaderMID = f.MID WHERE p.PID = %s"""
-        success, result = self.executor.execute_query(query, (pid,))
+        team_query = "SELECT lm.Name AS name, lm.MType AS type, w.Role AS role, w.Hours AS hours FROM WORKS w JOIN LAB_MEMBER lm ON w.MID = lm.MID WHERE w.PID = %s ORDER BY w.Role"
+        fund_query = "SELECT g.Source AS source, g.Budget AS budget FROM FUNDS f JOIN GRANT_TABLE g ON f.GID = g.GID WHERE f.PID = %s"
+        total_query = "SELECT COALESCE(SUM(g.Budget), 0) AS total FROM FUNDS f JOIN GRANT_TABLE g ON f.GID = g.GID WHERE f.PID = %s"
+        success, results = self.executor.execute_batched_json([(query, (pid,)), (team_query, (pid,)), (fund_query, (pid,)), (total_query, (pid,))])
+        result, team, funding, totals = results if success else ([], [], [], [])
         
         if not success or not result:
             print_error(f"Project with ID {pid} not found.")
@@ -477,22 +916,17 @@ class ProjectManager:
         print(f"  Expected Duration: {format_value(p.get('expected_duration'), 'N/A')} months")
         print(f"  Leader: {format_value(p.get('leader_name'), 'Unassigned')} ({format_value(p.get('leader_dept'), 'N/A')})")
         
-        team_query = "SELECT lm.Name AS name, lm.MType AS type, w.Role AS role, w.Hours AS hours FROM WORKS w JOIN LAB_MEMBER lm ON w.MID = lm.MID WHERE w.PID = %s ORDER BY w.Role"
-        success2, team = self.executor.execute_query(team_query, (pid,))
-        if success2 and team:
+        if team:
             print_subheader("Team Members")
             print(format_table(team, ['name', 'type', 'role', 'hours']))
             print(f"Total: {len(team)} members")
         else:
             print_info("No team members assigned.")
         
-        fund_query = "SELECT g.Source AS source, g.Budget AS budget FROM FUNDS f JOIN GRANT_TABLE g ON f.GID = g.GID WHERE f.PID = %s"
-        success3, funding = self.executor.execute_query(fund_query, (pid,))
-        if success3 and funding:
+        if funding:
             print_subheader("Funding")
             print(format_table(funding, ['source', 'budget']))
-            total = sum((f.get('budget') or 0) for f in funding)
-            print(f"Total: ${total:,.2f}")
+            print(f"Total: {format_currency(totals[0].get('total'))}")
         else:
             print_info("No funding sources.")
     
@@ -508,8 +942,7 @@ class ProjectManager:
         status = get_choice("Enter status (Active/Completed/Paused): ", ['Active', 'Completed', 'Paused'])
         if not status: return
         
-        faculty_query = "SELECT lm.MID AS mid, lm.Name AS name, f.Department AS dept FROM LAB_MEMBER lm JOIN FACULTY f ON lm.MID = f.MID ORDER BY lm.Name"
-        success, faculty = self.executor.execute_query(faculty_query)
+        success, faculty = self._get_faculty()
         if success and faculty:
             print("\nAvailable Faculty:")
             print(format_table(faculty, ['mid', 'name', 'dept']))
@@ -529,6 +962,8 @@ class ProjectManager:
             print_error(f"Failed to create project: {pid}")
     
     def _assign_team(self, pid: int) -> None:
+        # Keyed by MID so a member entered twice keeps the last role/hours (one row per conflict key)
+        assignments = {}
         while True:
             mid = get_int_input("Enter Member ID (0 to finish): ", min_val=0)
             if mid is None or mid == 0: break
@@ -536,21 +971,30 @@ class ProjectManager:
             if not role: continue
             hours = get_float_input("Enter weekly hours: ", min_val=0, max_val=168)
             if hours is None: continue
-            query = "INSERT INTO WORKS (MID, PID, Role, Hours) VALUES (%s, %s, %s, %s) ON CONFLICT (MID, PID) DO UPDATE SET Role = EXCLUDED.Role, Hours = EXCLUDED.Hours"
-            success, _ = self.executor.execute_update(query, (mid, pid, role, hours))
-            print_success(f"Member {mid} assigned.") if success else print_error("Assignment failed.")
+            assignments[mid] = (mid, pid, role, hours)
+        if not assignments: return
+        
+        query = "INSERT INTO WORKS (MID, PID, Role, Hours) VALUES %s ON CONFLICT (MID, PID) DO UPDATE SET Role = EXCLUDED.Role, Hours = EXCLUDED.Hours"
+        success, result = self.executor.execute_values_batch(query, list(assignments.values()))
+        if success:
+            print_success(f"Assigned members: {', '.join(str(mid) for mid in assignments)}")
+        else:
+            print_error(f"Assignment failed: {result}")
+    
+    def _apply_project_update(self, pid: int, query: str, params: tuple, message: str) -> None:
+        # The UPDATE doubles as the existence check: no matched row means no such project
+        success, count = self.executor.execute_update(query, params)
+        if not success:
+            print_error(f"Update failed: {count}")
+        elif count == 0:
+            print_error(f"Project with ID {pid} not found.")
+        else:
+            print_success(message)
     
     def update_project(self) -> None:
         pid = get_int_input("Enter Project ID: ", min_val=1)
         if pid is None: return
         
-        success, result = self.executor.execute_query("SELECT Title, Status FROM PROJECT WHERE PID = %s", (pid,))
-        if not success or not result:
-            print_error(f"Project with ID {pid} not found.")
-            return
-        
-        p = result[0]
-        print(f"\nCurrent: {format_value(p.get('title'))} ({format_value(p.get('status'))})")
         print("1. Title\n2. Status\n3. End Date\n4. Leader\n5. Team")
         choice = get_int_input("Update (1-5): ", 1, 5)
         if choice is None: return
@@ -558,26 +1002,21 @@ class ProjectManager:
         if choice == 1:
             new_title = get_input("New title: ")
             if new_title:
-                self.executor.execute_update("UPDATE PROJECT SET Title = %s WHERE PID = %s", (new_title, pid))
-                print_success("Title updated.")
+                self._apply_project_update(pid, "UPDATE PROJECT SET Title = %s WHERE PID = %s", (new_title, pid), "Title updated.")
         elif choice == 2:
             new_status = get_choice("New status (Active/Completed/Paused): ", ['Active', 'Completed', 'Paused'])
             if new_status:
-                self.executor.execute_update("UPDATE PROJECT SET Status = %s WHERE PID = %s", (new_status, pid))
-                print_success("Status updated.")
+                self._apply_project_update(pid, "UPDATE PROJECT SET Status = %s WHERE PID = %s", (new_status, pid), "Status updated.")
         elif choice == 3:
             new_date = get_date_input("New end date (or Enter to clear): ", allow_empty=True)
-            self.executor.execute_update("UPDATE PROJECT SET EDate = %s WHERE PID = %s", (new_date, pid))
-            print_success("End date updated.")
+            self._apply_project_update(pid, "UPDATE PROJECT SET EDate = %s WHERE PID = %s", (new_date, pid), "End date updated.")
         elif choice == 4:
-            faculty_query = "SELECT lm.MID AS mid, lm.Name AS name FROM LAB_MEMBER lm JOIN FACULTY f ON lm.MID = f.MID ORDER BY lm.Name"
-            success, faculty = self.executor.execute_query(faculty_query)
+            success, faculty = self._get_faculty()
             if success and faculty:
                 print(format_table(faculty, ['mid', 'name']))
                 new_leader = get_int_input("New Leader MID: ", min_val=1)
                 if new_leader:
-                    self.executor.execute_update("UPDATE PROJECT SET LeaderMID = %s WHERE PID = %s", (new_leader, pid))
-                    print_success("Leader updated.")
+                    self._apply_project_update(pid, "UPDATE PROJECT SET LeaderMID = %s WHERE PID = %s", (new_leader, pid), "Leader updated.")
         else:
             self._assign_team(pid)
     
@@ -594,14 +1033,18 @@ class ProjectManager:
         print_warning("This will remove all work assignments and funding.")
         
         if confirm_action():
-            success, _ = self.executor.execute_update("DELETE FROM PROJECT WHERE PID = %s", (pid,))
-            print_success("Project removed.") if success else print_error("Failed.")
+            success, count = self.executor.execute_update("DELETE FROM PROJECT WHERE PID = %s", (pid,))
+            if not success:
+                print_error("Failed.")
+            elif count == 0:
+                print_error(f"Project with ID {pid} not found.")
+            else:
+                print_success("Project removed.")
         else:
             print_info("Cancelled.")
     
     def show_members_by_grant(self) -> None:
-        grants_query = "SELECT GID AS gid, Source AS source, Budget AS budget FROM GRANT_TABLE ORDER BY GID"
-        success, grants = self.executor.execute_query(grants_query)
+        success, grants = self._get_grants()
         if success and grants:
             print_subheader("Grants")
             print(format_table(grants, ['gid', 'source', 'budget']))
@@ -640,8 +1083,8 @@ class ProjectManager:
                    m.StartDate AS start_date, m.EndDate AS end_date
                    FROM MENTORS m JOIN LAB_MEMBER mentor ON m.MentorMID = mentor.MID
                    JOIN LAB_MEMBER mentee ON m.MenteeMID = mentee.MID
-                   WHERE m.MentorMID IN (SELECT MID FROM WORKS WHERE PID = %s)
-                   AND m.MenteeMID IN (SELECT MID FROM WORKS WHERE PID = %s) ORDER BY mentor.Name"""
+                   JOIN WORKS w1 ON w1.MID = m.MentorMID JOIN WORKS w2 ON w2.MID = m.MenteeMID
+                   WHERE w1.PID = %s AND w2.PID = %s ORDER BY mentor.Name"""
         success, result = self.executor.execute_query(query, (pid, pid))
         if success and result:
             print_subheader(f"Mentorship in Project {pid}")
@@ -655,23 +1098,17 @@ class EquipmentManager:
         self.executor = executor
     
     def list_all_equipment(self) -> None:
-        query = """SELECT e.EID AS eid, e.EName AS name, e.EType AS type, e.PDate AS purchase_date, e.Status AS status,
-                   COUNT(CASE WHEN u.EDate IS NULL OR u.EDate >= CURRENT_DATE THEN 1 END) AS current_users
-                   FROM EQUIPMENT e LEFT JOIN USES u ON e.EID = u.EID
-                   GROUP BY e.EID, e.EName, e.EType, e.PDate, e.Status ORDER BY e.EID"""
-        success, result = self.executor.execute_query(query)
-        if success:
-            print_subheader("All Equipment")
-            print(format_table(result, ['eid', 'name', 'type', 'purchase_date', 'status', 'current_users']) if result else "No equipment found.")
-        else:
-            print_error(f"Failed: {result}")
+        def fetch_page(last_row):
+            after = last_row['eid'] if last_row else 0
+            return self.executor.execute_query(Q_LIST_EQUIPMENT, (after, PAGE_SIZE), cached=True)
+        print_subheader("All Equipment")
+        print_pages(fetch_page, ['eid', 'name', 'type', 'purchase_date', 'status', 'current_users'], "No equipment found.")
     
     def get_equipment_status(self) -> None:
         eid = get_int_input("Enter Equipment ID: ", min_val=1)
         if eid is None: return
         
-        query = "SELECT EID AS eid, EName AS name, EType AS type, PDate AS purchase_date, Status AS status FROM EQUIPMENT WHERE EID = %s"
-        success, result = self.executor.execute_query(query, (eid,))
+        success, result = self.executor.execute_query(Q_EQUIPMENT_STATUS, (eid,))
         if not success or not result:
             print_error(f"Equipment with ID {eid} not found.")
             return
@@ -681,11 +1118,8 @@ class EquipmentManager:
         print(f"  ID: {format_value(e.get('eid'))}\n  Type: {format_value(e.get('type'))}")
         print(f"  Purchase Date: {format_value(e.get('purchase_date'))}\n  Status: {format_value(e.get('status'))}")
         
-        users_query = """SELECT lm.Name AS name, lm.MType AS type, u.SDate AS start_date, u.Purpose AS purpose
-                        FROM USES u JOIN LAB_MEMBER lm ON u.MID = lm.MID
-                        WHERE u.EID = %s AND (u.EDate IS NULL OR u.EDate >= CURRENT_DATE) ORDER BY u.SDate"""
-        success2, users = self.executor.execute_query(users_query, (eid,))
-        if success2 and users:
+        users = e.get('users')
+        if users:
             print_subheader("Current Users")
             print(format_table(users, ['name', 'type', 'start_date', 'purpose']))
             print(f"Count: {len(users)}/3")
@@ -696,13 +1130,7 @@ class EquipmentManager:
         eid = get_int_input("Enter Equipment ID: ", min_val=1)
         if eid is None: return
         
-        query = """SELECT lm.MID AS mid, lm.Name AS name, lm.MType AS type, u.Purpose AS purpose,
-                   STRING_AGG(DISTINCT p.Title, ', ') AS projects
-                   FROM USES u JOIN LAB_MEMBER lm ON u.MID = lm.MID
-                   LEFT JOIN WORKS w ON lm.MID = w.MID LEFT JOIN PROJECT p ON w.PID = p.PID AND p.Status = 'Active'
-                   WHERE u.EID = %s AND (u.EDate IS NULL OR u.EDate >= CURRENT_DATE)
-                   GROUP BY lm.MID, lm.Name, lm.MType, u.Purpose ORDER BY lm.Name"""
-        success, result = self.executor.execute_query(query, (eid,))
+        success, result = self.executor.execute_query(Q_EQUIPMENT_USERS_AND_PROJECTS, (eid,))
         if success and result:
             print_subheader(f"Users of Equipment {eid} and Projects")
             print(format_table(result, ['mid', 'name', 'type', 'purpose', 'projects']))
@@ -724,17 +1152,20 @@ class EquipmentManager:
         success, eid = self.executor.execute_insert(query, (name, etype, pdate, status))
         print_success(f"Equipment '{name}' added with ID {eid}") if success else print_error(f"Failed: {eid}")
     
+    def _apply_equipment_update(self, eid: int, query: str, params: tuple) -> None:
+        # RETURNING doubles as the existence check: no row back means no such equipment
+        success, row = self.executor.execute_returning(query, params)
+        if not success:
+            print_error(f"Update failed: {row}")
+        elif row is None:
+            print_error(f"Equipment with ID {eid} not found.")
+        else:
+            print_success(f"Updated '{row['name']}'.")
+    
     def update_equipment(self) -> None:
         eid = get_int_input("Enter Equipment ID: ", min_val=1)
         if eid is None: return
         
-        success, result = self.executor.execute_query("SELECT EName AS name, Status AS status FROM EQUIPMENT WHERE EID = %s", (eid,))
-        if not success or not result:
-            print_error(f"Equipment with ID {eid} not found.")
-            return
-        
-        e = result[0]
-        print(f"\nCurrent: {format_value(e.get('name'))} ({format_value(e.get('status'))})")
         print("1. Name\n2. Type\n3. Status")
         choice = get_int_input("Update (1-3): ", 1, 3)
         if choice is None: return
@@ -742,41 +1173,35 @@ class EquipmentManager:
         if choice == 1:
             new_name = get_input("New name: ")
             if new_name:
-                self.executor.execute_update("UPDATE EQUIPMENT SET EName = %s WHERE EID = %s", (new_name, eid))
-                print_success("Updated.")
+                self._apply_equipment_update(eid, "UPDATE EQUIPMENT SET EName = %s WHERE EID = %s RETURNING EName AS name", (new_name, eid))
         elif choice == 2:
             new_type = get_input("New type: ")
             if new_type:
-                self.executor.execute_update("UPDATE EQUIPMENT SET EType = %s WHERE EID = %s", (new_type, eid))
-                print_success("Updated.")
+                self._apply_equipment_update(eid, "UPDATE EQUIPMENT SET EType = %s WHERE EID = %s RETURNING EName AS name", (new_type, eid))
         else:
             new_status = get_choice("New status (Available/In Use/Retired): ", ['Available', 'In Use', 'Retired'])
             if new_status:
-                self.executor.execute_update("UPDATE EQUIPMENT SET Status = %s WHERE EID = %s", (new_status, eid))
-                print_success("Updated.")
+                self._apply_equipment_update(eid, "UPDATE EQUIPMENT SET Status = %s WHERE EID = %s RETURNING EName AS name", (new_status, eid))
     
     def remove_equipment(self) -> None:
         eid = get_int_input("Enter Equipment ID: ", min_val=1)
         if eid is None: return
         
-        success, result = self.executor.execute_query("SELECT EName AS name FROM EQUIPMENT WHERE EID = %s", (eid,))
-        if not success or not result:
-            print_error(f"Equipment with ID {eid} not found.")
-            return
-        
-        print(f"\nEquipment: {format_value(result[0].get('name'))}")
-        print_warning("This will remove all usage records.")
-        
+        print_warning(f"This will remove equipment {eid} and all its usage records.")
         if confirm_action():
-            success, _ = self.executor.execute_update("DELETE FROM EQUIPMENT WHERE EID = %s", (eid,))
-            print_success("Removed.") if success else print_error("Failed.")
+            success, row = self.executor.execute_returning("DELETE FROM EQUIPMENT WHERE EID = %s RETURNING EName AS name", (eid,))
+            if not success:
+                print_error("Failed.")
+            elif row is None:
+                print_error(f"Equipment with ID {eid} not found.")
+            else:
+                print_success(f"Removed '{row['name']}'.")
         else:
             print_info("Cancelled.")
     
     def add_usage(self) -> None:
         print_subheader("Record Usage")
-        equip_query = "SELECT EID AS eid, EName AS name, Status AS status FROM EQUIPMENT WHERE Status != 'Retired' ORDER BY EID"
-        success, equipment = self.executor.execute_query(equip_query)
+        success, equipment = self.executor.execute_query(Q_USABLE_EQUIPMENT)
         if success and equipment:
             print(format_table(equipment, ['eid', 'name', 'status']))
         
@@ -789,19 +1214,20 @@ class EquipmentManager:
         purpose = get_input("Purpose: ")
         if not purpose: return
         
-        query = "INSERT INTO USES (MID, EID, SDate, EDate, Purpose) VALUES (%s, %s, %s, %s, %s)"
-        success, _ = self.executor.execute_update(query, (mid, eid, sdate, edate, purpose))
-        print_success("Usage recorded.") if success else print_error("Failed.")
+        query = """INSERT INTO USES (MID, EID, SDate, EDate, Purpose) VALUES (%s, %s, %s, %s, %s)
+                   RETURNING MID AS mid, EID AS eid, SDate AS start_date"""
+        success, usage = self.executor.execute_returning(query, (mid, eid, sdate, edate, purpose))
+        if success:
+            print_success(f"Usage recorded: member {usage['mid']} on equipment {usage['eid']} from {format_value(usage['start_date'])}.")
+        else:
+            print_error("Failed.")
     
     def update_usage(self) -> None:
         print_subheader("Update Usage")
         eid = get_int_input("Equipment ID: ", min_val=1)
         if eid is None: return
         
-        usage_query = """SELECT u.MID AS mid, lm.Name AS name, u.SDate AS start_date, u.Purpose AS purpose
-                        FROM USES u JOIN LAB_MEMBER lm ON u.MID = lm.MID
-                        WHERE u.EID = %s AND (u.EDate IS NULL OR u.EDate >= CURRENT_DATE) ORDER BY u.SDate"""
-        success, usage = self.executor.execute_query(usage_query, (eid,))
+        success, usage = self.executor.execute_query(Q_ACTIVE_USAGE, (eid,))
         if not success or not usage:
             print_info("No active usage found.")
             return
@@ -829,14 +1255,26 @@ class EquipmentManager:
 class ReportManager:
     def __init__(self, executor: QueryExecutor):
         self.executor = executor
+        self._grants_future: Optional[Future] = None
+    
+    def prefetch_grants(self, bg: ThreadPoolExecutor) -> None:
+        """Start loading the grants list into the executor's query cache on a background thread.
+
+        The rows land in the cache stamped with their fetch time, so an old prefetch that was
+        never used goes stale there like any other entry.
+        """
+        if self._grants_future is None or self._grants_future.done():
+            self._grants_future = bg.submit(self.executor.execute_query, Q_GRANTS, cached=True)
+    
+    def _get_grants(self) -> Tuple[bool, Any]:
+        # Wait for an in-flight prefetch rather than sending the same query alongside it
+        if self._grants_future is not None:
+            future, self._grants_future = self._grants_future, None
+            future.result()
+        return self.executor.execute_query(Q_GRANTS, cached=True)
     
     def member_with_most_publications(self) -> None:
-        query = """WITH pub_counts AS (
-                    SELECT lm.MID AS mid, lm.Name AS name, lm.MType AS type, COUNT(p.PubID) AS pub_count
-                    FROM LAB_MEMBER lm LEFT JOIN PUBLISHES p ON lm.MID = p.MID
-                    GROUP BY lm.MID, lm.Name, lm.MType)
-                   SELECT * FROM pub_counts WHERE pub_count = (SELECT MAX(pub_count) FROM pub_counts) ORDER BY name"""
-        success, result = self.executor.execute_query(query)
+        success, result = self.executor.execute_query(Q_MOST_PUBLICATIONS)
         if success and result:
             print_subheader("Member(s) with Most Publications")
             print(format_table(result, ['mid', 'name', 'type', 'pub_count']))
@@ -844,11 +1282,7 @@ class ReportManager:
             print_info("No publication data found.")
     
     def avg_publications_by_major(self) -> None:
-        query = """SELECT s.Major AS major, COUNT(DISTINCT s.MID) AS students, COUNT(p.PubID) AS total_pubs,
-                   ROUND(COUNT(p.PubID)::DECIMAL / NULLIF(COUNT(DISTINCT s.MID), 0), 2) AS avg_pubs
-                   FROM STUDENT s LEFT JOIN PUBLISHES p ON s.MID = p.MID
-                   GROUP BY s.Major ORDER BY avg_pubs DESC"""
-        success, result = self.executor.execute_query(query)
+        success, result = self.executor.execute_query(Q_AVG_PUBLICATIONS_BY_MAJOR)
         if success and result:
             print_subheader("Average Publications by Major")
             print(format_table(result, ['major', 'students', 'total_pubs', 'avg_pubs']))
@@ -862,26 +1296,16 @@ class ReportManager:
         end = get_date_input("Period end (YYYY-MM-DD): ")
         if end is None: return
         
-        query = """SELECT COUNT(DISTINCT p.PID) AS count FROM PROJECT p JOIN FUNDS f ON p.PID = f.PID
-                   WHERE p.SDate <= %s AND (p.EDate IS NULL OR p.EDate >= %s)"""
-        success, result = self.executor.execute_query(query, (end, start))
-        if success and result:
-            count = result[0].get('count', 0) or 0
+        success, details = self.executor.execute_query(Q_FUNDED_ACTIVE_PROJECTS, (end, start))
+        if success:
+            count = len(details)
             print(f"\nFunded projects active during {start} to {end}: {count}")
             
             if count > 0 and confirm_action("Show details? (y/n): "):
-                detail_query = """SELECT DISTINCT p.PID AS pid, p.Title AS title, p.Status AS status,
-                                 p.SDate AS start_date, p.EDate AS end_date, STRING_AGG(DISTINCT g.Source, ', ') AS grants
-                                 FROM PROJECT p JOIN FUNDS f ON p.PID = f.PID JOIN GRANT_TABLE g ON f.GID = g.GID
-                                 WHERE p.SDate <= %s AND (p.EDate IS NULL OR p.EDate >= %s)
-                                 GROUP BY p.PID, p.Title, p.Status, p.SDate, p.EDate ORDER BY p.Title"""
-                success2, details = self.executor.execute_query(detail_query, (end, start))
-                if success2 and details:
-                    print(format_table(details, ['pid', 'title', 'status', 'start_date', 'end_date', 'grants']))
+                print(format_table(details, ['pid', 'title', 'status', 'start_date', 'end_date', 'grants']))
     
     def prolific_members_by_grant(self) -> None:
-        grants_query = "SELECT GID AS gid, Source AS source, Budget AS budget FROM GRANT_TABLE ORDER BY GID"
-        success, grants = self.executor.execute_query(grants_query)
+        success, grants = self._get_grants()
         if success and grants:
             print_subheader("Grants")
             print(format_table(grants, ['gid', 'source', 'budget']))
@@ -892,12 +1316,7 @@ class ReportManager:
         gid = get_int_input("Enter Grant ID: ", min_val=1)
         if gid is None: return
         
-        query = """SELECT lm.MID AS mid, lm.Name AS name, lm.MType AS type, COUNT(DISTINCT pub.PubID) AS pub_count
-                   FROM GRANT_TABLE g JOIN FUNDS f ON g.GID = f.GID JOIN PROJECT p ON f.PID = p.PID
-                   JOIN WORKS w ON p.PID = w.PID JOIN LAB_MEMBER lm ON w.MID = lm.MID
-                   LEFT JOIN PUBLISHES pub ON lm.MID = pub.MID
-                   WHERE g.GID = %s GROUP BY lm.MID, lm.Name, lm.MType ORDER BY pub_count DESC LIMIT 3"""
-        success, result = self.executor.execute_query(query, (gid,))
+        success, result = self.executor.execute_query(Q_PROLIFIC_MEMBERS_BY_GRANT, (gid,))
         if success and result:
             print_subheader(f"Top 3 Prolific Members for Grant {gid}")
             print(format_table(result, ['mid', 'name', 'type', 'pub_count']))
@@ -905,49 +1324,66 @@ class ReportManager:
             print_info("No members found.")
     
     def list_all_publications(self) -> None:
-        query = """SELECT pub.PubID AS pubid, pub.Title AS title, pub.PubDate AS date, pub.Venue AS venue,
-                   COALESCE(STRING_AGG(lm.Name, ', ' ORDER BY lm.Name), 'No authors') AS authors
-                   FROM PUBLICATION pub LEFT JOIN PUBLISHES p ON pub.PubID = p.PubID
-                   LEFT JOIN LAB_MEMBER lm ON p.MID = lm.MID
-                   GROUP BY pub.PubID, pub.Title, pub.PubDate, pub.Venue ORDER BY pub.PubDate DESC"""
-        success, result = self.executor.execute_query(query)
-        if success:
-            print_subheader("All Publications")
-            print(format_table(result, ['pubid', 'title', 'date', 'venue', 'authors']) if result else "No publications found.")
-        else:
-            print_error(f"Failed: {result}")
+        def fetch_page(last_row):
+            if last_row is None:
+                return self.executor.execute_query(Q_LIST_PUBLICATIONS, (PAGE_SIZE,))
+            return self.executor.execute_query(Q_LIST_PUBLICATIONS_AFTER, (last_row['date'], last_row['pubid'], PAGE_SIZE))
+        print_subheader("All Publications")
+        print_pages(fetch_page, ['pubid', 'title', 'date', 'venue', 'authors'], "No publications found.")
     
     def list_all_grants(self) -> None:
-        query = """SELECT g.GID AS gid, g.Source AS source, g.Budget AS budget, g.StartDate AS start_date,
-                   g.Duration AS duration, COALESCE(STRING_AGG(p.Title, ', '), 'None') AS projects
-                   FROM GRANT_TABLE g LEFT JOIN FUNDS f ON g.GID = f.GID LEFT JOIN PROJECT p ON f.PID = p.PID
-                   GROUP BY g.GID, g.Source, g.Budget, g.StartDate, g.Duration ORDER BY g.StartDate DESC"""
-        success, result = self.executor.execute_query(query)
-        if success:
+        try:
             print_subheader("All Grants")
-            print(format_table(result, ['gid', 'source', 'budget', 'start_date', 'duration', 'projects']) if result else "No grants found.")
-        else:
-            print_error(f"Failed: {result}")
+            found = False
+            for columns, batch in self.executor.execute_query_stream(Q_LIST_GRANTS):
+                found = True
+                print(format_table(batch, ['gid', 'source', 'budget', 'start_date', 'duration', 'projects'], columns=columns))
+            if not found:
+                print("No grants found.")
+        except Error as e:
+            print_error(f"Failed: {e}")
 
 
 class ResearchLabManager:
-    def __init__(self):
-        self.config = DatabaseConfig()
-        self.executor = QueryExecutor(self.config)
+    def __init__(self, config: DatabaseConfig = None):
+        self.config = config or DatabaseConfig()
+        self.pool = create_pool(self.config)
+        # Background thread for prefetching lookups while the user reads a menu
+        self._bg = ThreadPoolExecutor(max_workers=1)
+        atexit.register(self.close)
+        self.executor = QueryExecutor(self.pool)
         self.member_mgr = MemberManager(self.executor)
         self.project_mgr = ProjectManager(self.executor)
         self.equipment_mgr = EquipmentManager(self.executor)
         self.report_mgr = ReportManager(self.executor)
     
     def test_connection(self) -> bool:
+        # Borrow straight from the pool: the check runs on a connection the menus will reuse,
+        # and putconn rolls back the open transaction without a separate COMMIT
         try:
-            with DatabaseConnection(self.config) as conn:
+            conn = self.pool.getconn()
+            try:
                 with conn.cursor() as cur:
                     cur.execute("SELECT 1")
-                    return True
+            finally:
+                self.pool.putconn(conn)
         except Exception as e:
             print_error(f"Database connection failed: {e}")
             return False
+        
+        success, error = self.executor.execute_update(PROJECTS_WITH_LEADER_VIEW)
+        if not success:
+            print_warning(f"Could not create view v_projects_with_leader: {error}")
+        for index_sql in REPORT_INDEXES:
+            success, error = self.executor.execute_update(index_sql)
+            if not success:
+                print_warning(f"Could not update indexes: {error}")
+        return True
+    
+    def close(self) -> None:
+        self._bg.shutdown(wait=True)
+        if not self.pool.closed:
+            self.pool.closeall()
     
     def main_menu(self) -> None:
         while True:
@@ -1012,6 +1448,7 @@ class ResearchLabManager:
             pause()
     
     def report_menu(self) -> None:
+        self.report_mgr.prefetch_grants(self._bg)
         while True:
             print_header("GRANT AND PUBLICATION REPORTING")
             print("\n--- View Data ---")
@@ -1034,16 +1471,25 @@ class ResearchLabManager:
 
 
 def main():
+    if os.name == 'nt':
+        os.system('')  # Enables ANSI escape processing in the Windows console
     print_header("RESEARCH LAB MANAGER")
     print("Initializing...")
+    # Turn SIGTERM into a normal exit so the atexit hook closes pooled connections
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     
-    app = ResearchLabManager()
-    
+    config = DatabaseConfig()
     print("\nTesting database connection...")
-    if not app.test_connection():
+    try:
+        app = ResearchLabManager(config)
+    except Error as e:
+        print_error(f"Database connection failed: {e}")
+        app = None
+    
+    if app is None or not app.test_connection():
         print(f"\nCheck configuration:")
-        print(f"  Host: {app.config.host}\n  Port: {app.config.port}")
-        print(f"  Database: {app.config.database}\n  User: {app.config.user}")
+        print(f"  Host: {config.host}\n  Port: {config.port}")
+        print(f"  Database: {config.database}\n  User: {config.user}")
         print("\nSet environment variables: DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD")
         return
     
@@ -158,11 +158,21 @@ CREATE INDEX idx_lab_member_type ON LAB_MEMBER(MType);
 CREATE INDEX idx_project_status ON PROJECT(Status);
 CREATE INDEX idx_project_dates ON PROJECT(SDate, EDate);
 CREATE INDEX idx_equipment_status ON EQUIPMENT(Status);
-CREATE INDEX idx_publication_date ON PUBLICATION(PubDate);
 CREATE INDEX idx_works_pid ON WORKS(PID);
 CREATE INDEX idx_works_mid ON WORKS(MID);
 CREATE INDEX idx_funds_gid ON FUNDS(GID);
-CREATE INDEX idx_uses_eid ON USES(EID);
+CREATE INDEX idx_uses_eid_edate ON USES(EID, EDate);
+CREATE INDEX idx_publishes_pubid ON PUBLISHES(PubID);
+CREATE INDEX idx_funds_pid ON FUNDS(PID);
+CREATE INDEX idx_publication_pubdate_pubid ON PUBLICATION(PubDate DESC, PubID DESC);
+
+-- Trigram indexes let the app's substring searches (Name ILIKE '%term%') use an index
+-- Requires the pg_trgm extension from postgresql-contrib
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_lab_member_name_trgm ON LAB_MEMBER USING gin (Name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_faculty_department_trgm ON FACULTY USING gin (Department gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_student_major_trgm ON STUDENT USING gin (Major gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_collaborator_affiliation_trgm ON COLLABORATOR USING gin (Affiliation gin_trgm_ops);
 
 -- ============================================
 -- TRIGGER FUNCTIONS AND TRIGGERS
@@ -379,6 +389,18 @@ FROM PROJECT p
 LEFT JOIN LAB_MEMBER lm ON p.LeaderMID = lm.MID
 LEFT JOIN FACULTY f ON p.LeaderMID = f.MID;
 
+-- View: Project listing with leader name (used by the app's project list)
+CREATE OR REPLACE VIEW v_projects_with_leader AS
+SELECT 
+    p.PID AS pid,
+    p.Title AS title,
+    p.Status AS status,
+    p.SDate AS start_date,
+    p.EDate AS end_date,
+    COALESCE(lm.Name, 'Unassigned') AS leader
+FROM PROJECT p
+LEFT JOIN LAB_MEMBER lm ON p.LeaderMID = lm.MID;
+
 -- View: Equipment usage summary
 CREATE OR REPLACE VIEW v_equipment_usage AS
 SELECT 